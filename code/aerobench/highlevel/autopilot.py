@@ -71,11 +71,19 @@ class Autopilot(Freezable):
 
         assert rv.size % 4 == 0, "get_u_ref should return Nz, ps, Ny_r, throttle for each aircraft"
 
-        for i in range(rv.size //4):
-            Nz, _ps, _Ny_r, _throttle = rv[4*i:4*(i+1)]
+        l, u = self.llc.ctrlLimits.NzMin, self.llc.ctrlLimits.NzMax
 
-            l, u = self.llc.ctrlLimits.NzMin, self.llc.ctrlLimits.NzMax
+        if rv.size == 4:
+            # a scalar comparison is faster than the array one for the common single-aircraft case
+            Nz = rv[0]
             assert l <= Nz <= u, f"autopilot commanded invalid Nz ({Nz}). Not in range [{l}, {u}]"
+        else:
+            # check the commanded Nz of all aircraft at once
+            Nz = rv[0::4]
+            in_range = (l <= Nz) & (Nz <= u)
+
+            assert in_range.all(), \
+                f"autopilot commanded invalid Nz ({Nz[np.argmin(in_range)]}). Not in range [{l}, {u}]"
 
         return rv
 
@@ -11,20 +11,24 @@ from numpy import deg2rad
 
 from aerobench.lowlevel.subf16_model import subf16_model
 from aerobench.lowlevel.low_level_controller import LowLevelController
+from aerobench.util import MODEL_MORELLI
 
-def controlled_f16(t, x_f16, u_ref, llc, f16_model='morelli', v2_integrators=False):
-    'returns the LQR-controlled F-16 state derivatives and more'
+def controlled_f16(t, x_f16, u_ref, llc, model_id=MODEL_MORELLI, v2_integrators=False, xd_out=None):
+    '''returns the LQR-controlled F-16 state derivatives and more
+
+    model_id is one of the aerobench.util.MODEL_* constants
+
+    if xd_out is passed in, the state derivatives are written into it rather than a newly-allocated array
+    '''
 
     assert isinstance(x_f16, np.ndarray)
     assert isinstance(llc, LowLevelController)
     assert u_ref.size == 4
 
-    assert f16_model in ['stevens', 'morelli'], 'Unknown F16_model: {}'.format(f16_model)
-
     x_ctrl, u_deg = llc.get_u_deg(u_ref, x_f16)
 
     # Note: Control vector (u) for subF16 is in units of degrees
-    xd_model, Nz, Ny, _, _ = subf16_model(x_f16[0:13], u_deg, f16_model)
+    xd_model, Nz, Ny, _, _ = subf16_model(x_f16[0:13], u_deg, model_id)
 
     if v2_integrators:
         # integrators from matlab v2 model
@@ -38,7 +42,7 @@ def controlled_f16(t, x_f16, u_ref, llc, f16_model='morelli', v2_integrators=Fal
         # Calculate (side force + yaw rate) term
         Ny_r = Ny + x_ctrl[5]
 
-    xd = np.zeros((x_f16.shape[0],))
+    xd = np.zeros((x_f16.shape[0],)) if xd_out is None else xd_out
     xd[:len(xd_model)] = xd_model
 
     # integrators from low-level controller
@@ -51,10 +55,25 @@ def controlled_f16(t, x_f16, u_ref, llc, f16_model='morelli', v2_integrators=Fal
     u_rad = np.zeros((7,)) # throt, ele, ail, rud, Nz_ref, ps_ref, Ny_r_ref
 
     u_rad[0] = u_deg[0] # throttle
-
-    for i in range(1, 4):
-        u_rad[i] = deg2rad(u_deg[i])
+    u_rad[1:4] = deg2rad(u_deg[1:4])
 
     u_rad[4:7] = u_ref[0:3] # inner-loop commands are 4-7
 
     return xd, u_rad, Nz, ps, Ny_r
+
+def controlled_f16_batch(t, x_f16s, u_refs, llc, model_id=MODEL_MORELLI, v2_integrators=False, xd_out=None):
+    '''returns the LQR-controlled F-16 state derivatives for a batch of aircraft
+
+    x_f16s is an (N, num_vars) array of aircraft states and u_refs is an (N, 4) array of reference inputs.
+    The result is an (N, num_vars) array with one row of derivatives per aircraft, written into xd_out if given.
+    '''
+
+    assert x_f16s.ndim == 2 and u_refs.shape == (x_f16s.shape[0], 4)
+
+    if xd_out is None:
+        xd_out = np.empty(x_f16s.shape)
+
+    for i in range(x_f16s.shape[0]):
+        controlled_f16(t, x_f16s[i], u_refs[i], llc, model_id, v2_integrators, xd_out=xd_out[i])
+
+    return xd_out
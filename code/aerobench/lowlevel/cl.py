@@ -8,10 +8,7 @@ import numpy as np
 
 from aerobench.util import fix, sign
 
-def cl(alpha, beta):
-    'cl function'
-
-    a = np.array([[0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0], \
+CL_TABLE = np.array([[0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0], \
     [-.001, -.004, -.008, -.012, -.016, -.022, -.022, -.021, -.015, -.008, -.013, -.015], \
     [-.003, -.009, -.017, -.024, -.030, -.041, -.045, -.040, -.016, -.002, -.010, -.019], \
     [-.001, -.010, -.020, -.030, -.039, -.054, -.057, -.054, -.023, -.006, -.014, -.027], \
@@ -19,6 +16,9 @@ def cl(alpha, beta):
     [.007, -.010, -.023, -.034, -.049, -.063, -.081, -.079, -.060, -.058, -.062, -.059], \
     [.009, -.011, -.023, -.037, -.050, -.068, -.089, -.088, -.091, -.076, -.077, -.076]], dtype=float).T
 
+def cl(alpha, beta):
+    'cl function'
+
     s = .2 * alpha
     k = fix(s)
 
@@ -44,10 +44,10 @@ def cl(alpha, beta):
     k = k + 3
     m = m + 1
     n = n + 1
-    t = a[k-1, m-1]
-    u = a[k-1, n-1]
-    v = t + abs(da) * (a[l-1, m-1] - t)
-    w = u + abs(da) * (a[l-1, n-1] - u)
+    t = CL_TABLE[k-1, m-1]
+    u = CL_TABLE[k-1, n-1]
+    v = t + abs(da) * (CL_TABLE[l-1, m-1] - t)
+    w = u + abs(da) * (CL_TABLE[l-1, n-1] - u)
     dum = v + (w - v) * abs(db)
 
     return dum * sign(beta)
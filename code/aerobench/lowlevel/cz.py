@@ -7,12 +7,12 @@ Cz function
 import numpy as np
 from aerobench.util import fix, sign
 
+CZ_TABLE = np.array([.770, .241, -.100, -.415, -.731, -1.053, -1.355, -1.646, -1.917, -2.120, -2.248, -2.229], \
+    dtype=float).T
+
 def cz(alpha, beta, el):
     'cz function'
 
-    a = np.array([.770, .241, -.100, -.415, -.731, -1.053, -1.355, -1.646, -1.917, -2.120, -2.248, -2.229], \
-        dtype=float).T
-
     s = .2 * alpha
     k = fix(s)
 
@@ -26,6 +26,6 @@ def cz(alpha, beta, el):
     l = k + fix(1.1 * sign(da))
     l = l + 3
     k = k + 3
-    s = a[k-1] + abs(da) * (a[l-1] - a[k-1])
+    s = CZ_TABLE[k-1] + abs(da) * (CZ_TABLE[l-1] - CZ_TABLE[k-1])
 
     return s * (1 - (beta / 57.3)**2) - .19 * (el / 25)
@@ -7,10 +7,7 @@ dlda function
 import numpy as np
 from aerobench.util import fix, sign
 
-def dlda(alpha, beta):
-    'dlda function'
-
-    a = np.array([[-.041, -.052, -.053, -.056, -.050, -.056, -.082, -.059, -.042, -.038, -.027, -.017], \
+DLDA_TABLE = np.array([[-.041, -.052, -.053, -.056, -.050, -.056, -.082, -.059, -.042, -.038, -.027, -.017], \
     [-.041, -.053, -.053, -.053, -.050, -.051, -.066, -.043, -.038, -.027, -.023, -.016], \
     [-.042, -.053, -.052, -.051, -.049, -.049, -.043, -.035, -.026, -.016, -.018, -.014], \
     [-.040, -.052, -.051, -.052, -.048, -.048, -.042, -.037, -.031, -.026, -.017, -.012], \
@@ -18,6 +15,9 @@ def dlda(alpha, beta):
     [-.044, -.048, -.048, -.047, -.042, -.041, -.020, -.028, -.013, -.014, -.011, -.010], \
     [-.043, -.049, -.047, -.045, -.042, -.037, -.003, -.013, -.010, -.003, -.007, -.008]], dtype=float).T
 
+def dlda(alpha, beta):
+    'dlda function'
+
     s = .2 * alpha
     k = fix(s)
     if k <= -2:
@@ -42,9 +42,9 @@ def dlda(alpha, beta):
     k = k + 3
     m = m + 4
     n = n + 4
-    t = a[k-1, m-1]
-    u = a[k-1, n-1]
-    v = t + abs(da) * (a[l-1, m-1] - t)
-    w = u + abs(da) * (a[l-1, n-1] - u)
+    t = DLDA_TABLE[k-1, m-1]
+    u = DLDA_TABLE[k-1, n-1]
+    v = t + abs(da) * (DLDA_TABLE[l-1, m-1] - t)
+    w = u + abs(da) * (DLDA_TABLE[l-1, n-1] - u)
 
     return v + (w - v) * abs(db)
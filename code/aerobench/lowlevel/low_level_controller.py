@@ -36,6 +36,9 @@ class LowLevelController(Freezable):
                         0.0, 0.0, 0.0, 1000.0, 9.0567], dtype=float).transpose()
     old_uequil = np.array([0.1395, -0.7496, 0.0, 0.0], dtype=float).transpose()
 
+    # state indices of the controller inputs: [alpha, q, int_e_Nz, beta, p, r, int_e_ps, int_e_Ny_r]
+    ctrl_state_indices = np.array([1, 7, 13, 2, 6, 8, 14, 15])
+
     def __init__(self, gain_str='old'):
         # Hard coded LQR gain matrix from matlab version
 
@@ -67,7 +70,7 @@ class LowLevelController(Freezable):
         ## Implement LQR Feedback Control
         # Reorder states to match controller:
         # [alpha, q, int_e_Nz, beta, p, r, int_e_ps, int_e_Ny_r]
-        x_ctrl = np.array([x_delta[i] for i in [1, 7, 13, 2, 6, 8, 14, 15]], dtype=float)
+        x_ctrl = x_delta[LowLevelController.ctrl_state_indices]
 
         # Initialize control vectors
         u_deg = np.zeros((4,)) # throt, ele, ail, rud
@@ -43,14 +43,17 @@ from aerobench.lowlevel.dndr import dndr
 from aerobench.lowlevel.dampp import dampp
 
 from aerobench.lowlevel.morellif16 import Morellif16
+from aerobench.util import MODEL_STEVENS, MODEL_MORELLI
 
-def subf16_model(x, u, model, adjust_cy=True):
+def subf16_model(x, u, model_id, adjust_cy=True):
     '''output aircraft state vector derivative for a given input
 
     The reference for the model is Appendix A of Stevens & Lewis
+
+    model_id is one of the aerobench.util.MODEL_* constants
     '''
 
-    assert model in ['stevens', 'morelli']
+    assert model_id in (MODEL_STEVENS, MODEL_MORELLI), f"Unknown F16 model id: {model_id}"
     assert len(x) == 13
     assert len(u) == 4
 
@@ -101,7 +104,7 @@ def subf16_model(x, u, model, adjust_cy=True):
 
     # component build up
 
-    if model == 'stevens':
+    if model_id == MODEL_STEVENS:
         # stevens & lewis (look up table version)
         cxt = cx(alpha, el)
         cyt = cy(beta, ail, rdr)
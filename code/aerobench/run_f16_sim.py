@@ -4,25 +4,37 @@ run_f16_sim python version
 '''
 
 import time
+from math import floor
+from concurrent.futures import ProcessPoolExecutor
 
 import numpy as np
 from scipy.integrate import RK45
 
-from aerobench.highlevel.controlled_f16 import controlled_f16
-from aerobench.util import get_state_names, Euler
+from aerobench.highlevel.controlled_f16 import controlled_f16, controlled_f16_batch
+from aerobench.util import get_state_names, Euler, DormandPrince, hermite_interp, MODEL_IDS
+
+# initial number of rows in the history buffers, which grow as needed
+INITIAL_CAPACITY = 1024
 
 def run_f16_sim(initial_state, tmax, ap, step=1/30, extended_states=False, model_str='morelli',
-                integrator_str='rk45', v2_integrators=False):
+                integrator_str='rk45', v2_integrators=False, integrator_kwargs=None):
     '''Simulates and analyzes autonomous F-16 maneuvers
 
     if multiple aircraft are to be simulated at the same time,
     initial_state should be the concatenated full (including integrators) initial state.
 
+    tmax can be np.inf, in which case the simulation runs until the autopilot is finished.
+
+    integrator_kwargs are extra keyword arguments for the integrator, for example rtol, atol or max_step
+    with rk45 or dopri5. Passing max_step=step (and first_step=step with rk45) forces the adaptive integrators
+    to take at least one step per sample. This is not the default: rk45 usually takes several samples per
+    step, so the derivative is evaluated several times more often.
+
     returns a dict with the following keys:
 
     'status': integration status, should be 'finished' if no errors, or 'autopilot finished'
-    'times': time history
-    'states': state history at each time step
+    'times': time history (1-d numpy array)
+    'states': state history at each time step (2-d numpy array, one row per time step)
     'modes': mode history at each time step
 
     if extended_states was True, result also includes:
@@ -30,13 +42,14 @@ def run_f16_sim(initial_state, tmax, ap, step=1/30, extended_states=False, model
     'ps_list' - ps at each time step
     'Nz_list' - Nz at each time step
     'Ny_r_list' - Ny_r at each time step
-    'u_list' - input at each time step, input is 7-tuple: throt, ele, ail, rud, Nz_ref, ps_ref, Ny_r_ref
-    These are tuples if multiple aircraft are used
+    'u_list' - input at each time step, input is 7 values: throt, ele, ail, rud, Nz_ref, ps_ref, Ny_r_ref
+    These are numpy arrays with one row per time step. If multiple aircraft are used, each row has an
+    extra leading axis with one entry per aircraft, for example 'Nz_list' has shape (num_steps, num_aircraft).
     '''
 
     start = time.perf_counter()
 
-    initial_state = np.array(initial_state, dtype=float)
+    initial_state = np.asarray(initial_state, dtype=float)
     llc = ap.llc
 
     num_vars = len(get_state_names()) + llc.get_num_integrators()
@@ -49,129 +62,242 @@ def run_f16_sim(initial_state, tmax, ap, step=1/30, extended_states=False, model
         x0 = initial_state
 
     assert x0.size % num_vars == 0, f"expected initial state ({x0.size} vars) to be multiple of {num_vars} vars"
+    num_aircraft = x0.size // num_vars
+
+    assert model_str in MODEL_IDS, f"Unknown F16 model: {model_str}"
+    model_id = MODEL_IDS[model_str]
 
     # run the numerical simulation
-    times = [0]
-    states = [x0]
+    # the sample times are multiples of step up to tmax, computed from the sample index rather than accumulated
+    # (which drifts). Sample times within time_tol of the integrator time count as landing on it, so rounding
+    # in step * n does not push a sample to the next step.
+    time_tol = 1e-9
+
+    # number of samples up to tmax, or None if tmax is infinite (run until the autopilot is finished)
+    max_steps = floor(tmax / step + time_tol) + 1 if np.isfinite(tmax) else None
+
+    # the output buffers start small and grow geometrically up to max_steps, so a large (or infinite) tmax
+    # does not reserve memory for samples that are never taken when the autopilot finishes early
+    capacity = INITIAL_CAPACITY if max_steps is None else min(max_steps, INITIAL_CAPACITY)
+    times = np.empty(capacity)
+    states = np.empty((capacity, x0.size))
+    modes = []
+
+    times[0] = 0
+    states[0] = x0
+    num_steps = 1
 
     # mode can change at time 0
-    ap.advance_discrete_mode(times[-1], states[-1])
+    ap.advance_discrete_mode(times[0], states[0])
 
-    modes = [ap.mode]
+    modes.append(ap.mode)
 
     if extended_states:
-        xd, u, Nz, ps, Ny_r = get_extended_states(ap, times[-1], states[-1], model_str, v2_integrators)
+        shape = (capacity,) if num_aircraft == 1 else (capacity, num_aircraft)
+
+        xd_arr = np.empty(shape + (num_vars,))
+        u_arr = np.empty(shape + (7,))
+        Nz_arr = np.empty(shape)
+        ps_arr = np.empty(shape)
+        Ny_r_arr = np.empty(shape)
 
-        xd_list = [xd]
-        u_list = [u]
-        Nz_list = [Nz]
-        ps_list = [ps]
-        Ny_r_list = [Ny_r]
+        xd_arr[0], u_arr[0], Nz_arr[0], ps_arr[0], Ny_r_arr[0] = \
+            get_extended_states(ap, times[0], states[0], model_id, v2_integrators, num_vars)
 
-    der_func = make_der_func(ap, model_str, v2_integrators)
+    der_func = make_der_func(ap, model_id, v2_integrators, num_aircraft)
 
     if integrator_str == 'rk45':
         integrator_class = RK45
         kwargs = {}
+    elif integrator_str == 'dopri5':
+        integrator_class = DormandPrince
+        kwargs = {}
     else:
         assert integrator_str == 'euler'
         integrator_class = Euler
         kwargs = {'step': step}
 
+    if integrator_kwargs is not None:
+        kwargs.update(integrator_kwargs)
+
     # note: fixed_step argument is unused by rk45, used with euler
-    integrator = integrator_class(der_func, times[-1], states[-1], tmax, **kwargs)
+    integrator = integrator_class(der_func, times[0], states[0], tmax, **kwargs)
 
     while integrator.status == 'running':
         integrator.step()
 
-        if integrator.t >= times[-1] + step:
-            dense_output = integrator.dense_output()
+        # for euler, the interpolant is built lazily, at most once per integrator step, and only if a sample
+        # falls strictly inside the step (samples landing on integrator.t use integrator.y)
+        dense_output = None
 
-            while integrator.t >= times[-1] + step:
-                t = times[-1] + step
-                #print(f"{round(t, 2)} / {tmax}")
+        while max_steps is None or num_steps < max_steps:
+            t = step * num_steps
 
-                times.append(t)
-                states.append(dense_output(t))
+            if num_steps + 1 == max_steps:
+                t = min(t, tmax) # step * n can round to just above tmax, where the integrator stops
 
-                updated = ap.advance_discrete_mode(times[-1], states[-1])
-                modes.append(ap.mode)
+            if integrator.t + time_tol < t:
+                break
 
-                # re-run dynamics function at current state to get non-state variables
-                if extended_states:
-                    xd, u, Nz, ps, Ny_r = get_extended_states(ap, times[-1], states[-1], model_str, v2_integrators)
+            #print(f"{round(t, 2)} / {tmax}")
 
-                    xd_list.append(xd)
-                    u_list.append(u)
+            if num_steps == capacity:
+                capacity = 2 * capacity if max_steps is None else min(2 * capacity, max_steps)
+                times = grow_buffer(times, capacity)
+                states = grow_buffer(states, capacity)
 
-                    Nz_list.append(Nz)
-                    ps_list.append(ps)
-                    Ny_r_list.append(Ny_r)
-
-                if ap.is_finished(times[-1], states[-1]):
-                    # this both causes the outer loop to exit and sets res['status'] appropriately
-                    integrator.status = 'autopilot finished'
-                    break
-
-                if updated:
-                    # re-initialize the integration class on discrete mode switches
-                    integrator = integrator_class(der_func, times[-1], states[-1], tmax, **kwargs)
-                    break
+                if extended_states:
+                    xd_arr, u_arr, Nz_arr, ps_arr, Ny_r_arr = \
+                        [grow_buffer(a, capacity) for a in (xd_arr, u_arr, Nz_arr, ps_arr, Ny_r_arr)]
+
+            times[num_steps] = t
+
+            if abs(t - integrator.t) <= time_tol:
+                states[num_steps] = integrator.y
+            elif integrator_class is RK45:
+                # cubic hermite interpolation between the step end points, rather than constructing
+                # RK45's dense output object
+                hermite_interp(t, integrator.t_old, integrator.y_old, integrator.K[0],
+                               integrator.t, integrator.y, integrator.f, out=states[num_steps])
+            elif integrator_class is DormandPrince:
+                hermite_interp(t, integrator.tprev, integrator.yprev, integrator.K[0],
+                               integrator.t, integrator.y, integrator.K[6], out=states[num_steps])
+            else:
+                if dense_output is None:
+                    dense_output = integrator.dense_output()
+
+                states[num_steps] = dense_output(t)
+
+            state = states[num_steps]
+            updated = ap.advance_discrete_mode(t, state)
+            modes.append(ap.mode)
+
+            # re-run dynamics function at current state to get non-state variables
+            if extended_states:
+                n = num_steps
+                xd_arr[n], u_arr[n], Nz_arr[n], ps_arr[n], Ny_r_arr[n] = \
+                    get_extended_states(ap, t, state, model_id, v2_integrators, num_vars)
+
+            num_steps += 1
+
+            if ap.is_finished(t, state):
+                # this both causes the outer loop to exit and sets res['status'] appropriately
+                integrator.status = 'autopilot finished'
+                break
+
+            if updated:
+                # restart the integration on discrete mode switches
+                if hasattr(integrator, 'reset'):
+                    integrator.reset(t, state)
+                else:
+                    # scipy's RK45 has no public way to restart, so construct a new one
+                    integrator = integrator_class(der_func, t, state, tmax, **kwargs)
+
+                break
 
     assert 'finished' in integrator.status
 
     res = {}
     res['status'] = integrator.status
-    res['times'] = times
-    res['states'] = np.array(states, dtype=float)
+    res['times'] = trim_buffer(times, num_steps)
+    res['states'] = trim_buffer(states, num_steps)
     res['modes'] = modes
 
     if extended_states:
-        res['xd_list'] = xd_list
-        res['ps_list'] = ps_list
-        res['Nz_list'] = Nz_list
-        res['Ny_r_list'] = Ny_r_list
-        res['u_list'] = u_list
+        res['xd_list'] = trim_buffer(xd_arr, num_steps)
+        res['ps_list'] = trim_buffer(ps_arr, num_steps)
+        res['Nz_list'] = trim_buffer(Nz_arr, num_steps)
+        res['Ny_r_list'] = trim_buffer(Ny_r_arr, num_steps)
+        res['u_list'] = trim_buffer(u_arr, num_steps)
 
     res['runtime'] = time.perf_counter() - start
 
     return res
 
-def make_der_func(ap, model_str, v2_integrators):
+def grow_buffer(arr, size):
+    'return a larger copy of a history buffer, with room for size rows'
+
+    rv = np.empty((size,) + arr.shape[1:])
+    rv[:arr.shape[0]] = arr
+
+    return rv
+
+def trim_buffer(arr, num_rows):
+    '''return the first num_rows rows of a history buffer
+
+    this is a copy if the buffer has unused rows, so the returned array does not keep the whole buffer alive
+    '''
+
+    return arr if num_rows == arr.shape[0] else arr[:num_rows].copy()
+
+def run_f16_sim_batch(initial_states, tmax, aps, max_workers=None, **kwargs):
+    '''Simulates many independent F-16 scenarios in parallel, using a pool of processes
+
+    initial_states and aps are lists with one entry per simulation. Autopilots have state, so each
+    simulation needs its own (picklable) autopilot instance. The simulations run in worker processes, so
+    the passed-in autopilot objects are not updated. The remaining keyword arguments are passed to run_f16_sim.
+
+    To advance several aircraft in lock step with a single integrator (for example, if they interact), use
+    run_f16_sim with the concatenated initial state instead.
+
+    returns a list of run_f16_sim result dicts, in the same order as initial_states
+    '''
+
+    assert len(initial_states) == len(aps), "expected one autopilot per initial state"
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(run_f16_sim, init, tmax, ap, **kwargs) for init, ap in zip(initial_states, aps)]
+
+        return [f.result() for f in futures]
+
+def make_der_func(ap, model_id, v2_integrators, num_aircraft):
     'make the combined derivative function for integration'
 
-    def der_func(t, full_state):
-        'derivative function, generalized for multiple aircraft'
+    # constant for the whole simulation, so compute it once rather than on every derivative call
+    num_vars = len(get_state_names()) + ap.llc.get_num_integrators()
 
-        u_refs = ap.get_checked_u_ref(t, full_state)
+    if num_aircraft == 1:
+        # the common case, specialized to skip the per-aircraft reshaping and batching
+        def der_func_1(t, state):
+            'derivative function for a single aircraft'
+
+            u_ref = ap.get_checked_u_ref(t, state)
+            assert u_ref.size == 4, "expected reference inputs for a single aircraft"
 
-        num_aircraft = u_refs.size // 4
-        num_vars = len(get_state_names()) + ap.llc.get_num_integrators()
-        assert full_state.size // num_vars == num_aircraft
+            return controlled_f16(t, state, u_ref, ap.llc, model_id, v2_integrators)[0]
 
-        xds = []
+        return der_func_1
+
+    def der_func(t, full_state):
+        'derivative function, generalized for multiple aircraft'
 
-        for i in range(num_aircraft):
-            state = full_state[num_vars*i:num_vars*(i+1)]
-            u_ref = u_refs[4*i:4*(i+1)]
+        u_refs = ap.get_checked_u_ref(t, full_state)
+        assert u_refs.size == 4 * num_aircraft, f"expected reference inputs for {num_aircraft} aircraft"
 
-            xd = controlled_f16(t, state, u_ref, ap.llc, model_str, v2_integrators)[0]
-            xds.append(xd)
+        # each aircraft's derivatives are written directly into its slice of rv. This is a new array on
+        # every call rather than a reused buffer, since scipy's RK45 keeps the returned derivative
+        # (as self.f) and re-reads it after later evaluations, for example when a step is rejected
+        rv = np.empty(full_state.size)
 
-        rv = np.hstack(xds)
+        # view the flat state as one row per aircraft, so all aircraft are evaluated in a single batched call
+        states = full_state.reshape(num_aircraft, num_vars)
+        xds = rv.reshape(num_aircraft, num_vars)
+        controlled_f16_batch(t, states, u_refs.reshape(num_aircraft, 4), ap.llc, model_id, v2_integrators,
+                             xd_out=xds)
 
         return rv
-    
+
     return der_func
 
-def get_extended_states(ap, t, full_state, model_str, v2_integrators):
+def get_extended_states(ap, t, full_state, model_id, v2_integrators, num_vars):
     '''get xd, u, Nz, ps, Ny_r at the current time / state
 
+    num_vars is the number of variables per aircraft (including integrators)
+
     returns tuples if more than one aircraft
     '''
 
     llc = ap.llc
-    num_vars = len(get_state_names()) + llc.get_num_integrators()
     num_aircraft = full_state.size // num_vars
 
     xd_tup = []
@@ -186,7 +312,7 @@ def get_extended_states(ap, t, full_state, model_str, v2_integrators):
         state = full_state[num_vars*i:num_vars*(i+1)]
         u_ref = u_refs[4*i:4*(i+1)]
 
-        xd, u, Nz, ps, Ny_r = controlled_f16(t, state, u_ref, llc, model_str, v2_integrators)
+        xd, u, Nz, ps, Ny_r = controlled_f16(t, state, u_ref, llc, model_id, v2_integrators)
 
         xd_tup.append(xd)
         u_tup.append(u)
@@ -32,6 +32,12 @@ class StateIndex:
     
     POW = 12
 
+# f16 aerodynamic models, resolved from their string names once at simulation setup
+MODEL_STEVENS = 0 # stevens & lewis (look up table version)
+MODEL_MORELLI = 1 # morelli (polynomial version)
+
+MODEL_IDS = {'stevens': MODEL_STEVENS, 'morelli': MODEL_MORELLI}
+
 class Freezable():
     'a class where you can freeze the fields (prevent new fields from being created)'
 
@@ -59,6 +65,8 @@ class Euler(Freezable):
 
         self.der_func = der_func # signature (t, x)
         self.tstep = step
+        self.tstart = tstart
+        self.num_steps = 0
         self.t = tstart
         self.y = ystart.copy()
         self.yprev = None
@@ -71,6 +79,17 @@ class Euler(Freezable):
 
         self.freeze_attrs()
 
+    def reset(self, t, y):
+        'restart integration from the given time and state, reusing this object'
+
+        self.tstart = t
+        self.num_steps = 0
+        self.t = t
+        self.y[:] = y
+        self.yprev = None
+        self.tprev = None
+        self.status = 'running'
+
     def step(self):
         'take one step'
 
@@ -79,7 +98,9 @@ class Euler(Freezable):
             self.tprev = self.t
             yd = self.der_func(self.t, self.y)
 
-            self.t += self.tstep
+            # computed from the step count rather than accumulated, so step times stay on the step grid
+            self.num_steps += 1
+            self.t = self.tstart + self.num_steps * self.tstep
 
             if self.t + self.time_tol >= self.tend:
                 self.t = self.tend
@@ -109,6 +130,204 @@ class Euler(Freezable):
 
         return fun
 
+class DormandPrince(Freezable):
+    '''adaptive step Dormand-Prince 5(4) integration
+
+    same algorithm as scipy.integrate.RK45, but with all stage buffers allocated once up front and
+    PI step-size control. Dense output is cubic hermite interpolation between the step end points.
+    '''
+
+    C = np.array([0, 1/5, 3/10, 4/5, 8/9, 1], dtype=float)
+
+    A = np.array([[0, 0, 0, 0, 0],
+                  [1/5, 0, 0, 0, 0],
+                  [3/40, 9/40, 0, 0, 0],
+                  [44/45, -56/15, 32/9, 0, 0],
+                  [19372/6561, -25360/2187, 64448/6561, -212/729, 0],
+                  [9017/3168, -355/33, 46732/5247, 49/176, -5103/18656]], dtype=float)
+
+    B = np.array([35/384, 0, 500/1113, 125/192, -2187/6784, 11/84], dtype=float)
+
+    # difference between the 5th and embedded 4th order solutions, used for the error estimate
+    E = np.array([-71/57600, 0, 71/16695, -71/1920, 17253/339200, -22/525, 1/40], dtype=float)
+
+    def __init__(self, der_func, tstart, ystart, tend, rtol=1e-3, atol=1e-6, max_step=np.inf, time_tol=1e-9):
+        assert tend > tstart
+        assert max_step > 0
+
+        self.der_func = der_func # signature (t, x)
+        self.tend = tend
+
+        self.rtol = rtol
+        self.atol = atol
+        self.max_step = max_step
+        self.time_tol = time_tol
+
+        # all buffers are allocated once here, and reused by step() and reset()
+        self.y = np.array(ystart, dtype=float)
+        self.yprev = np.empty_like(self.y)
+        self.ynew = np.empty_like(self.y)
+        self.ystage = np.empty_like(self.y)
+        self.err = np.empty_like(self.y)
+        self.scale = np.empty_like(self.y)
+
+        # stage derivatives; K[6] is the derivative at the end of the last step (first same as last)
+        self.K = np.empty((7, self.y.size))
+
+        self.reset(tstart, self.y)
+
+        self.freeze_attrs()
+
+    def reset(self, t, y):
+        'restart integration from the given time and state, reusing this object and its buffers'
+
+        self.t = t
+        self.y[:] = y
+        self.tprev = None
+        self.facold = 1e-4 # previous error norm, used by the PI step-size controller
+
+        if t + self.time_tol >= self.tend:
+            self.h = 0
+            self.status = 'finished'
+        else:
+            self.K[6] = self.der_func(t, self.y)
+            self.h = self.initial_step()
+            self.status = 'running'
+
+    def error_norm(self, vec):
+        'root-mean-square norm of a vector'
+
+        return np.sqrt(np.dot(vec, vec) / vec.size)
+
+    def initial_step(self):
+        'get the initial step size (Hairer, Norsett & Wanner, Solving ODEs I, p. 169)'
+
+        f0 = self.K[6]
+        np.multiply(np.abs(self.y), self.rtol, out=self.scale)
+        self.scale += self.atol
+
+        d0 = self.error_norm(self.y / self.scale)
+        d1 = self.error_norm(f0 / self.scale)
+
+        h0 = 1e-6 if d0 < 1e-5 or d1 < 1e-5 else 0.01 * d0 / d1
+        h0 = min(h0, self.tend - self.t)
+
+        f1 = self.der_func(self.t + h0, self.y + h0 * f0)
+        d2 = self.error_norm((f1 - f0) / self.scale) / h0
+
+        if d1 <= 1e-15 and d2 <= 1e-15:
+            h1 = max(1e-6, h0 * 1e-3)
+        else:
+            h1 = (0.01 / max(d1, d2))**(1/5)
+
+        return min(100 * h0, h1, self.max_step)
+
+    def step(self):
+        'take one step, retrying with smaller step sizes until the error estimate is within tolerance'
+
+        if self.status != 'running':
+            return
+
+        t, y, K = self.t, self.y, self.K
+        ystage, ynew, err, scale = self.ystage, self.ynew, self.err, self.scale
+
+        K[0] = K[6]
+        h = min(self.h, self.max_step)
+        rejected = False
+
+        # same minimum step as scipy's RK45; below it, t + h cannot be told apart from t
+        min_step = 10 * np.spacing(t)
+
+        while True:
+            if h < min_step:
+                # step size underflow, for example if the derivative became nan
+                self.status = 'failed'
+                return
+
+            if t + h + self.time_tol >= self.tend:
+                h = self.tend - t
+
+            for s in range(1, 6):
+                np.dot(self.A[s, :s], K[:s], out=ystage)
+                ystage *= h
+                ystage += y
+                K[s] = self.der_func(t + self.C[s] * h, ystage)
+
+            np.dot(self.B, K[:6], out=ynew)
+            ynew *= h
+            ynew += y
+            K[6] = self.der_func(t + h, ynew)
+
+            np.dot(self.E, K, out=err)
+            err *= h
+
+            np.maximum(np.abs(y), np.abs(ynew), out=scale)
+            scale *= self.rtol
+            scale += self.atol
+            err /= scale
+
+            err_norm = self.error_norm(err)
+            fac11 = err_norm**0.17
+
+            if err_norm <= 1:
+                break
+
+            # rejected, retry with a smaller step
+            h /= min(5, fac11 / 0.9)
+            rejected = True
+
+        # PI step-size control, factor is limited to [0.2, 10]
+        fac = fac11 / self.facold**0.04
+        fac = max(0.1, min(5, fac / 0.9))
+        self.h = h / fac if not rejected else min(h / fac, h)
+        self.facold = max(err_norm, 1e-4)
+
+        # swap buffers rather than copying
+        self.yprev, self.y, self.ynew = y, ynew, self.yprev
+        self.tprev = t
+        self.t = t + h
+
+        if self.t + self.time_tol >= self.tend:
+            self.t = self.tend
+            self.status = 'finished'
+
+    def dense_output(self):
+        'return a function of time'
+
+        assert self.tprev is not None
+
+        # the returned function reads the integrator's buffers rather than copies of them, so it is only valid
+        # until the next call to step(), which overwrites them
+        tprev, yprev, tcur, ycur = self.tprev, self.yprev, self.t, self.y
+        fprev, fcur = self.K[0], self.K[6]
+
+        def fun(t):
+            'return state at time t (cubic hermite interpolation)'
+
+            return hermite_interp(t, tprev, yprev, fprev, tcur, ycur, fcur)
+
+        return fun
+
+def hermite_interp(t, t0, y0, f0, t1, y1, f1, out=None):
+    '''cubic hermite interpolation of the state at time t in [t0, t1], given the state (y) and
+    derivative (f) at both ends of an integration step
+
+    if out is passed in, the result is written into it
+    '''
+
+    h = t1 - t0
+    theta = (t - t0) / h
+
+    if out is None:
+        out = np.empty_like(y0)
+
+    np.multiply(y0, (1 - theta)**2 * (1 + 2 * theta), out=out)
+    out += theta**2 * (3 - 2 * theta) * y1
+    out += theta * (1 - theta)**2 * h * f0
+    out += theta**2 * (theta - 1) * h * f1
+
+    return out
+
 def get_state_names():
     'returns a list of state variable names'
 
@@ -225,7 +444,7 @@ def extract_single_result(res, index, llc):
             key_list = ['xd_list', 'ps_list', 'Nz_list', 'Ny_r_list', 'u_list']
 
             for key in key_list:
-                rv[key] = [tup[index] for tup in res[key]]
+                rv[key] = res[key][:, index]
 
     return rv
 
@@ -0,0 +1,79 @@
+'''
+tests for the integrators and interpolation in aerobench.util
+
+run from the code directory with: python -m pytest tests
+'''
+
+import numpy as np
+
+from aerobench.util import DormandPrince, hermite_interp
+
+def harmonic_oscillator(_t, y):
+    'second derivative of x is -x, with y = [x, dx/dt]. Starting from [1, 0], x = cos(t)'
+
+    return np.array([y[1], -y[0]])
+
+def test_dormand_prince_harmonic_oscillator():
+    'DormandPrince should track the known solution, with smaller error at tighter tolerances'
+
+    tmax = 10
+    errors = []
+
+    for rtol in [1e-3, 1e-6, 1e-9]:
+        integrator = DormandPrince(harmonic_oscillator, 0, np.array([1.0, 0.0]), tmax, rtol=rtol, atol=rtol)
+
+        while integrator.status == 'running':
+            integrator.step()
+
+        assert integrator.status == 'finished'
+        assert integrator.t == tmax
+
+        errors.append(np.max(np.abs(integrator.y - [np.cos(tmax), -np.sin(tmax)])))
+
+    assert errors[0] < 1e-2
+    assert errors[2] < 1e-7
+    assert errors[0] > errors[1] > errors[2]
+
+def test_dormand_prince_dense_output():
+    'the interpolant between step end points should stay close to the known solution'
+
+    integrator = DormandPrince(harmonic_oscillator, 0, np.array([1.0, 0.0]), 10, rtol=1e-8, atol=1e-8)
+
+    while integrator.status == 'running':
+        integrator.step()
+        fun = integrator.dense_output()
+
+        for t in np.linspace(integrator.tprev, integrator.t, 5):
+            assert np.allclose(fun(t), [np.cos(t), -np.sin(t)], rtol=0, atol=1e-5)
+
+def test_dormand_prince_fails_on_nan():
+    'a nan derivative should end integration with status failed, rather than retrying forever'
+
+    def der_func(t, _y):
+        'derivative that becomes nan after t = 0.5'
+
+        return np.array([np.nan if t > 0.5 else 1.0])
+
+    integrator = DormandPrince(der_func, 0, np.array([0.0]), 2)
+
+    while integrator.status == 'running':
+        integrator.step()
+
+    assert integrator.status == 'failed'
+    assert integrator.t <= 0.5
+
+def test_hermite_interp_convergence():
+    'cubic hermite interpolation error should shrink with the fourth power of the interval'
+
+    errors = []
+
+    for dt in [0.1, 0.05]:
+        t0, t1 = 1.0, 1.0 + dt
+        y0, y1 = np.array([np.sin(t0)]), np.array([np.sin(t1)])
+        f0, f1 = np.array([np.cos(t0)]), np.array([np.cos(t1)])
+
+        tmid = t0 + dt / 2
+        errors.append(abs(hermite_interp(tmid, t0, y0, f0, t1, y1, f1)[0] - np.sin(tmid)))
+
+    # halving the interval should reduce the error by about 2^4 = 16
+    assert 12 < errors[0] / errors[1] < 20